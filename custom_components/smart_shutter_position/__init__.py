@@ -6,8 +6,15 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .const import DOMAIN
+from .const import (
+    CONF_COVERS,
+    CONF_TIME_TO_CLOSE,
+    CONF_TIME_TO_OPEN,
+    DOMAIN,
+    SIGNAL_TIMING_UPDATED,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +33,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry."""
+    if entry.version > 2:
+        return False
+
+    if entry.version == 1:
+        # Version 1 stored {source_entity, time_to_close, time_to_open} per
+        # cover; version 2 keys by source entity and stores [open, close].
+        covers = {
+            entity_id: [config[CONF_TIME_TO_OPEN], config[CONF_TIME_TO_CLOSE]]
+            for entity_id, config in entry.data.get(CONF_COVERS, {}).items()
+        }
+        hass.config_entries.async_update_entry(
+            entry, data={CONF_COVERS: covers}, version=2
+        )
+        _LOGGER.debug(
+            "Migrated Smart Shutter Position entry %s to version 2",
+            entry.entry_id,
+        )
+
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -38,7 +68,22 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    previous = hass.data[DOMAIN][entry.entry_id]
+    if previous == entry.data:
+        return
+    hass.data[DOMAIN][entry.entry_id] = entry.data
+
+    # Only a change in the set of source covers needs new entities;
+    # timing edits are applied to the live entities in place.
+    old_covers = previous.get(CONF_COVERS, {})
+    new_covers = entry.data.get(CONF_COVERS, {})
+    if old_covers.keys() != new_covers.keys():
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    async_dispatcher_send(
+        hass, SIGNAL_TIMING_UPDATED.format(entry.entry_id), new_covers
+    )
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 import voluptuous as vol
 
@@ -27,24 +28,67 @@ from homeassistant.helpers.selector import (
 from .const import (
     DOMAIN,
     CONF_COVERS,
-    CONF_SOURCE_ENTITY,
     CONF_TIME_TO_OPEN,
     CONF_TIME_TO_CLOSE,
+    DEFAULT_TIME,
+    MAX_TIME,
+    MIN_TIME,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class CoverTiming(NamedTuple):
+    """Travel times entered for a source cover, stored as a list."""
+
+    time_to_open: float
+    time_to_close: float
+
+
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_COVERS): EntitySelector(
+        EntitySelectorConfig(
+            domain=COVER_DOMAIN,
+            device_class=CoverDeviceClass.SHUTTER,
+            multiple=True,
+        )
+    ),
+})
+
+
+_TIME_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=MIN_TIME,
+        max=MAX_TIME,
+        step=0.5,
+        unit_of_measurement="s",
+        mode=NumberSelectorMode.BOX,
+    )
+)
+
+
+@lru_cache(maxsize=64)
+def _timing_schema(
+    time_to_close: float = DEFAULT_TIME, time_to_open: float = DEFAULT_TIME
+) -> vol.Schema:
+    """Return the timing form schema shared by config and options flows."""
+    return vol.Schema({
+        vol.Required(CONF_TIME_TO_CLOSE, default=time_to_close): _TIME_SELECTOR,
+        vol.Required(CONF_TIME_TO_OPEN, default=time_to_open): _TIME_SELECTOR,
+    })
+
+
 class SmartShutterPositionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Smart Shutter Position."""
 
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._selected_covers: list[str] = []
         self._current_cover_index: int = 0
-        self._calibration_data: dict[str, dict] = {}
+        self._calibration_data: dict[str, CoverTiming] = {}
+        self._cover_names: list[str] = []
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -57,41 +101,35 @@ class SmartShutterPositionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not selected:
                 errors["base"] = "no_cover_selected"
             else:
-                filtered = []
-                for entity_id in selected:
-                    state = self.hass.states.get(entity_id)
-                    if state:
-                        device_class = state.attributes.get(ATTR_DEVICE_CLASS)
-                        if device_class == CoverDeviceClass.SHUTTER:
-                            filtered.append(entity_id)
-
-                if not filtered:
+                states_get = self.hass.states.get
+                shutter = CoverDeviceClass.SHUTTER
+                shutters = [
+                    state
+                    for entity_id in selected
+                    if (state := states_get(entity_id))
+                    and state.attributes.get(ATTR_DEVICE_CLASS) == shutter
+                ]
+
+                if not shutters:
                     errors["base"] = "no_shutter_selected"
                 else:
-                    self._selected_covers = filtered
+                    self._selected_covers = [state.entity_id for state in shutters]
+                    self._cover_names = [
+                        state.attributes.get(ATTR_FRIENDLY_NAME, state.entity_id)
+                        for state in shutters
+                    ]
                     self._current_cover_index = 0
                     return await self.async_step_timing()
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(CONF_COVERS): EntitySelector(
-                    EntitySelectorConfig(
-                        domain=COVER_DOMAIN,
-                        multiple=True,
-                    )
-                ),
-            }),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
     def _get_current_cover_name(self) -> str:
         """Get friendly name of current cover."""
-        entity_id = self._selected_covers[self._current_cover_index]
-        state = self.hass.states.get(entity_id)
-        if state:
-            return state.attributes.get(ATTR_FRIENDLY_NAME, entity_id)
-        return entity_id
+        return self._cover_names[self._current_cover_index]
 
     def _get_current_entity_id(self) -> str:
         """Get current entity ID."""
@@ -105,11 +143,10 @@ class SmartShutterPositionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         cover_name = self._get_current_cover_name()
 
         if user_input is not None:
-            self._calibration_data[entity_id] = {
-                CONF_SOURCE_ENTITY: entity_id,
-                CONF_TIME_TO_CLOSE: user_input[CONF_TIME_TO_CLOSE],
-                CONF_TIME_TO_OPEN: user_input[CONF_TIME_TO_OPEN],
-            }
+            self._calibration_data[entity_id] = CoverTiming(
+                user_input[CONF_TIME_TO_OPEN],
+                user_input[CONF_TIME_TO_CLOSE],
+            )
 
             self._current_cover_index += 1
 
@@ -118,31 +155,17 @@ class SmartShutterPositionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 return self.async_create_entry(
                     title="Smart Shutter Position",
-                    data={CONF_COVERS: self._calibration_data},
+                    data={
+                        CONF_COVERS: {
+                            entity_id: list(timing)
+                            for entity_id, timing in self._calibration_data.items()
+                        }
+                    },
                 )
 
         return self.async_show_form(
             step_id="timing",
-            data_schema=vol.Schema({
-                vol.Required(CONF_TIME_TO_CLOSE, default=30): NumberSelector(
-                    NumberSelectorConfig(
-                        min=1,
-                        max=300,
-                        step=0.5,
-                        unit_of_measurement="s",
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Required(CONF_TIME_TO_OPEN, default=30): NumberSelector(
-                    NumberSelectorConfig(
-                        min=1,
-                        max=300,
-                        step=0.5,
-                        unit_of_measurement="s",
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
-            }),
+            data_schema=_timing_schema(),
             description_placeholders={
                 "cover_name": cover_name,
                 "current": str(self._current_cover_index + 1),
@@ -163,7 +186,9 @@ class SmartShutterOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
-        self._covers_data = dict(config_entry.data.get(CONF_COVERS, {}))
+        self._covers_data: dict[str, list[float]] = dict(
+            config_entry.data.get(CONF_COVERS, {})
+        )
         self._cover_ids = list(self._covers_data.keys())
         self._current_index = 0
 
@@ -181,17 +206,18 @@ class SmartShutterOptionsFlow(config_entries.OptionsFlow):
     ) -> config_entries.ConfigFlowResult:
         """Edit timing for a cover."""
         entity_id = self._cover_ids[self._current_index]
-        cover_data = self._covers_data[entity_id]
+        time_to_open, time_to_close = self._covers_data[entity_id]
 
         state = self.hass.states.get(entity_id)
         cover_name = state.attributes.get(ATTR_FRIENDLY_NAME, entity_id) if state else entity_id
 
         if user_input is not None:
-            self._covers_data[entity_id] = {
-                CONF_SOURCE_ENTITY: entity_id,
-                CONF_TIME_TO_CLOSE: user_input[CONF_TIME_TO_CLOSE],
-                CONF_TIME_TO_OPEN: user_input[CONF_TIME_TO_OPEN],
-            }
+            self._covers_data[entity_id] = list(
+                CoverTiming(
+                    user_input[CONF_TIME_TO_OPEN],
+                    user_input[CONF_TIME_TO_CLOSE],
+                )
+            )
 
             self._current_index += 1
 
@@ -207,32 +233,7 @@ class SmartShutterOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="edit_cover",
-            data_schema=vol.Schema({
-                vol.Required(
-                    CONF_TIME_TO_CLOSE,
-                    default=cover_data.get(CONF_TIME_TO_CLOSE, 30),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=1,
-                        max=300,
-                        step=0.5,
-                        unit_of_measurement="s",
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Required(
-                    CONF_TIME_TO_OPEN,
-                    default=cover_data.get(CONF_TIME_TO_OPEN, 30),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=1,
-                        max=300,
-                        step=0.5,
-                        unit_of_measurement="s",
-                        mode=NumberSelectorMode.BOX,
-                    )
-                ),
-            }),
+            data_schema=_timing_schema(time_to_close, time_to_open),
             description_placeholders={
                 "cover_name": cover_name,
                 "current": str(self._current_index + 1),
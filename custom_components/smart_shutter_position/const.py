@@ -4,12 +4,14 @@ DOMAIN = "smart_shutter_position"
 
 # Configuration keys
 CONF_COVERS = "covers"
-CONF_SOURCE_ENTITY = "source_entity"
 CONF_TIME_TO_OPEN = "time_to_open"
 CONF_TIME_TO_CLOSE = "time_to_close"
 
 # Defaults
 DEFAULT_TIMEOUT = 60  # seconds
+DEFAULT_TIME = 30  # seconds
+MIN_TIME = 1  # seconds
+MAX_TIME = 300  # seconds
 
 # States
 STATE_OPENING = "opening"
@@ -22,6 +24,9 @@ STATE_STOPPED = "stopped"
 POSITION_OPEN = 100
 POSITION_CLOSED = 0
 
+# Dispatcher signals
+SIGNAL_TIMING_UPDATED = f"{DOMAIN}_timing_updated_{{}}"
+
 # Storage
 STORAGE_KEY = f"{DOMAIN}_data"
 STORAGE_VERSION = 1
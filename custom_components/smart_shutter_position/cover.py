@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
 from typing import Any
 
 from homeassistant.components.cover import (
@@ -26,23 +25,34 @@ from homeassistant.const import (
     STATE_OPEN,
     STATE_OPENING,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from .const import (
     CONF_COVERS,
-    CONF_SOURCE_ENTITY,
-    CONF_TIME_TO_CLOSE,
-    CONF_TIME_TO_OPEN,
     DOMAIN,
     POSITION_CLOSED,
     POSITION_OPEN,
+    SIGNAL_TIMING_UPDATED,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Movement directions; idle is falsy so the direction doubles as a moving flag
+_DIR_IDLE = 0
+_DIR_OPENING = 1
+_DIR_CLOSING = 2
+
+# Service that halts a source cover without a stop service, by current state
+_STOP_FALLBACK = {
+    STATE_OPENING: SERVICE_CLOSE_COVER,
+    STATE_CLOSING: SERVICE_OPEN_COVER,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -52,19 +62,24 @@ async def async_setup_entry(
     """Set up Smart Shutter Position covers."""
     covers_config = entry.data.get(CONF_COVERS, {})
 
-    entities = []
-    for entity_id, config in covers_config.items():
-        entities.append(
-            SmartShutterCover(
-                hass,
-                entry,
-                config[CONF_SOURCE_ENTITY],
-                config[CONF_TIME_TO_OPEN],
-                config[CONF_TIME_TO_CLOSE],
-            )
+    async_add_entities([
+        SmartShutterCover(
+            entry,
+            entity_id,
+            _get_friendly_name(hass, entity_id),
+            time_to_open,
+            time_to_close,
         )
+        for entity_id, (time_to_open, time_to_close) in covers_config.items()
+    ])
+
 
-    async_add_entities(entities)
+def _get_friendly_name(hass: HomeAssistant, entity_id: str) -> str:
+    """Get friendly name of an entity, falling back to its ID."""
+    state = hass.states.get(entity_id)
+    if state:
+        return state.attributes.get(ATTR_FRIENDLY_NAME, entity_id)
+    return entity_id
 
 
 class SmartShutterCover(CoverEntity, RestoreEntity):
@@ -72,95 +87,100 @@ class SmartShutterCover(CoverEntity, RestoreEntity):
 
     _attr_device_class = CoverDeviceClass.SHUTTER
     _attr_has_entity_name = True
+    _attr_supported_features = (
+        CoverEntityFeature.OPEN
+        | CoverEntityFeature.CLOSE
+        | CoverEntityFeature.STOP
+        | CoverEntityFeature.SET_POSITION
+    )
 
     def __init__(
         self,
-        hass: HomeAssistant,
         entry: ConfigEntry,
         source_entity_id: str,
+        source_friendly_name: str,
         time_to_open: float,
         time_to_close: float,
     ) -> None:
         """Initialize the cover."""
-        self.hass = hass
         self._entry = entry
         self._source_entity_id = source_entity_id
-        self._time_to_open = time_to_open
-        self._time_to_close = time_to_close
+        self._set_timing(time_to_open, time_to_close)
+        self._service_data = ReadOnlyDict({"entity_id": source_entity_id})
 
         self._current_position: int = POSITION_CLOSED
         self._target_position: int | None = None
         self._movement_start_time: float | None = None
         self._movement_start_position: int | None = None
-        self._movement_direction: str | None = None
-        self._position_timer: asyncio.Task | None = None
+        self._movement_direction: int = _DIR_IDLE
+        self._position_timer: asyncio.TimerHandle | None = None
         self._unsub_state_change = None
+        self._unsub_timing_updated = None
+        self._source_supported_features: int | None = None
+        self._source_state: str | None = None
 
         source_entity_id_clean = source_entity_id.replace("cover.", "")
         self._attr_unique_id = f"smart_{source_entity_id_clean}"
-        self._attr_name = f"Smart {self._get_source_friendly_name()}"
+        self._source_friendly_name = source_friendly_name
+        self._attr_name = f"Smart {self._source_friendly_name}"
 
-    def _get_source_friendly_name(self) -> str:
-        """Get friendly name of source entity."""
-        state = self.hass.states.get(self._source_entity_id)
-        if state:
-            return state.attributes.get(ATTR_FRIENDLY_NAME, self._source_entity_id)
-        return self._source_entity_id
+    def _set_timing(self, time_to_open: float, time_to_close: float) -> None:
+        """Store travel times and the position rates derived from them."""
+        self._time_to_open = time_to_open
+        self._time_to_close = time_to_close
+        self._open_pct_per_sec = 100.0 / time_to_open
+        self._close_pct_per_sec = 100.0 / time_to_close
 
-    @property
-    def supported_features(self) -> CoverEntityFeature:
-        """Return supported features."""
-        features = (
-            CoverEntityFeature.OPEN
-            | CoverEntityFeature.CLOSE
-            | CoverEntityFeature.STOP
-            | CoverEntityFeature.SET_POSITION
-        )
-        return features
+    def _travel_time(self, delta: int) -> float:
+        """Return the seconds needed to move the cover by delta percent."""
+        time_for_full = self._time_to_open if delta > 0 else self._time_to_close
+        return abs(delta) * 0.01 * time_for_full
 
     @property
     def current_cover_position(self) -> int:
         """Return current position of cover."""
-        if self._is_moving():
+        if self._movement_direction:
             return self._calculate_current_position()
         return self._current_position
 
     @property
     def is_opening(self) -> bool:
         """Return if the cover is opening."""
-        return self._movement_direction == "opening"
+        return self._movement_direction == _DIR_OPENING
 
     @property
     def is_closing(self) -> bool:
         """Return if the cover is closing."""
-        return self._movement_direction == "closing"
+        return self._movement_direction == _DIR_CLOSING
 
     @property
     def is_closed(self) -> bool:
         """Return if the cover is closed."""
-        return self._current_position == POSITION_CLOSED and not self._is_moving()
-
-    def _is_moving(self) -> bool:
-        """Return if cover is currently moving."""
-        return self._movement_direction is not None
+        return (
+            self._current_position == POSITION_CLOSED and not self._movement_direction
+        )
 
     def _calculate_current_position(self) -> int:
         """Calculate current position based on movement time."""
         if not self._movement_start_time or self._movement_start_position is None:
             return self._current_position
 
-        elapsed = time.monotonic() - self._movement_start_time
+        elapsed = self.hass.loop.time() - self._movement_start_time
 
-        if self._movement_direction == "opening":
-            time_for_full = self._time_to_open
-            position_change = (elapsed / time_for_full) * 100
-            new_position = self._movement_start_position + position_change
+        if self._movement_direction == _DIR_OPENING:
+            new_position = (
+                self._movement_start_position + elapsed * self._open_pct_per_sec
+            )
         else:
-            time_for_full = self._time_to_close
-            position_change = (elapsed / time_for_full) * 100
-            new_position = self._movement_start_position - position_change
+            new_position = (
+                self._movement_start_position - elapsed * self._close_pct_per_sec
+            )
 
-        return max(POSITION_CLOSED, min(POSITION_OPEN, int(new_position)))
+        if new_position <= POSITION_CLOSED:
+            return POSITION_CLOSED
+        if new_position >= POSITION_OPEN:
+            return POSITION_OPEN
+        return int(new_position)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
@@ -177,124 +197,199 @@ class SmartShutterCover(CoverEntity, RestoreEntity):
                     self.entity_id,
                 )
 
+        self._update_source_cache(self.hass.states.get(self._source_entity_id))
+
         self._unsub_state_change = async_track_state_change_event(
             self.hass, [self._source_entity_id], self._async_source_state_changed
         )
+        self._unsub_timing_updated = async_dispatcher_connect(
+            self.hass,
+            SIGNAL_TIMING_UPDATED.format(self._entry.entry_id),
+            self._async_timing_updated,
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed."""
         if self._unsub_state_change:
             self._unsub_state_change()
-        await self._cancel_position_timer()
+        if self._unsub_timing_updated:
+            self._unsub_timing_updated()
+        self._cancel_position_timer()
 
     @callback
     def _async_source_state_changed(self, event) -> None:
         """Handle source cover state changes."""
         new_state = event.data.get("new_state")
+        self._update_source_cache(new_state)
         if not new_state:
             return
 
-        # Use current_position attribute for reset (0=closed, 100=open)
+        changed = False
+
+        friendly_name = new_state.attributes.get(ATTR_FRIENDLY_NAME)
+        if friendly_name is not None and friendly_name != self._source_friendly_name:
+            self._source_friendly_name = friendly_name
+            self._attr_name = f"Smart {friendly_name}"
+            changed = True
+
+        # Use current_position attribute for reset (0=closed, 100=open). An
+        # unchanged position only counts as an end stop when the source state
+        # has just moved into the matching open/closed state, so a source
+        # still reporting 0 while it starts opening does not end the movement.
         source_position = new_state.attributes.get(ATTR_CURRENT_POSITION)
-        if source_position == 0:
-            self._finalize_movement(POSITION_CLOSED)
-        elif source_position == 100:
-            self._finalize_movement(POSITION_OPEN)
+        old_state = event.data.get("old_state")
+        if old_state is None:
+            position_changed = state_changed = True
+        else:
+            position_changed = (
+                old_state.attributes.get(ATTR_CURRENT_POSITION) != source_position
+            )
+            state_changed = old_state.state != new_state.state
+
+        if source_position == 0 and (
+            position_changed or (state_changed and new_state.state == STATE_CLOSED)
+        ):
+            end_position = POSITION_CLOSED
+        elif source_position == 100 and (
+            position_changed or (state_changed and new_state.state == STATE_OPEN)
+        ):
+            end_position = POSITION_OPEN
+        else:
+            end_position = None
+
+        if end_position is not None and (
+            self._movement_direction or self._current_position != end_position
+        ):
+            self._finalize_movement(end_position)
+            changed = True
+
+        if changed:
+            self.async_write_ha_state()
+
+    def _update_source_cache(self, source_state: State | None) -> None:
+        """Cache the source cover state and supported features."""
+        if source_state is None:
+            self._source_state = None
+            self._source_supported_features = None
+            return
+
+        self._source_state = source_state.state
+        self._source_supported_features = source_state.attributes.get(
+            ATTR_SUPPORTED_FEATURES, 0
+        )
+
+    @callback
+    def _async_timing_updated(self, covers_config: dict[str, list[float]]) -> None:
+        """Apply timings edited in the options flow."""
+        timing = covers_config.get(self._source_entity_id)
+        if timing is None:
+            return
+
+        if not self._movement_direction:
+            self._set_timing(*timing)
+            return
+
+        # Rebase the movement on the current estimate so the new rates apply
+        # from now on instead of rewriting the distance already travelled.
+        self._current_position = self._calculate_current_position()
+        self._movement_start_position = self._current_position
+        self._movement_start_time = self.hass.loop.time()
+        self._set_timing(*timing)
+
+        if self._position_timer:
+            self._cancel_position_timer()
+            target_position = self._target_position
+            if target_position == self._current_position:
+                self._async_position_reached(target_position)
+                return
+            self._position_timer = self.hass.loop.call_later(
+                self._travel_time(target_position - self._current_position),
+                self._async_position_reached,
+                target_position,
+            )
 
         self.async_write_ha_state()
 
     def _finalize_movement(self, position: int) -> None:
         """Finalize movement and reset position."""
         self._current_position = position
-        self._movement_direction = None
+        self._reset_movement_state()
+        self._cancel_position_timer()
+
+    def _reset_movement_state(self) -> None:
+        """Clear movement tracking."""
+        self._movement_direction = _DIR_IDLE
         self._movement_start_time = None
         self._movement_start_position = None
         self._target_position = None
 
-        if self._position_timer and not self._position_timer.done():
-            self._position_timer.cancel()
-            self._position_timer = None
-
-    async def _cancel_position_timer(self) -> None:
-        """Cancel any running position timer."""
-        if self._position_timer and not self._position_timer.done():
+    def _cancel_position_timer(self) -> None:
+        """Cancel any pending position timer."""
+        if self._position_timer:
             self._position_timer.cancel()
-            try:
-                await self._position_timer
-            except asyncio.CancelledError:
-                pass
             self._position_timer = None
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
         await self._async_stop_and_calculate_position()
 
-        self._start_movement("opening", POSITION_OPEN)
+        self._start_movement(_DIR_OPENING, POSITION_OPEN)
 
         await self.hass.services.async_call(
             COVER_DOMAIN,
             SERVICE_OPEN_COVER,
-            {"entity_id": self._source_entity_id},
+            self._service_data,
         )
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
         await self._async_stop_and_calculate_position()
 
-        self._start_movement("closing", POSITION_CLOSED)
+        self._start_movement(_DIR_CLOSING, POSITION_CLOSED)
 
         await self.hass.services.async_call(
             COVER_DOMAIN,
             SERVICE_CLOSE_COVER,
-            {"entity_id": self._source_entity_id},
+            self._service_data,
         )
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
-        await self._async_stop_cover_internal()
+        await self._async_stop_and_calculate_position(send_device_stop=True)
 
-    async def _async_stop_cover_internal(self) -> None:
-        """Internal stop cover logic."""
-        if self._is_moving():
-            self._current_position = self._calculate_current_position()
+        self.async_write_ha_state()
 
-        self._movement_direction = None
-        self._movement_start_time = None
-        self._movement_start_position = None
-        self._target_position = None
+    async def _async_send_stop(self) -> None:
+        """Stop the source cover, reversing it if it has no stop service."""
+        if self._source_state is None:
+            return
 
-        await self._cancel_position_timer()
+        if self._source_supports_stop:
+            service = SERVICE_STOP_COVER
+        elif (service := _STOP_FALLBACK.get(self._source_state)) is None:
+            return
 
-        source_state = self.hass.states.get(self._source_entity_id)
-        if source_state:
-            features = source_state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
-            if features & CoverEntityFeature.STOP:
-                await self.hass.services.async_call(
-                    COVER_DOMAIN,
-                    SERVICE_STOP_COVER,
-                    {"entity_id": self._source_entity_id},
-                )
-            else:
-                if source_state.state == STATE_OPENING:
-                    await self.hass.services.async_call(
-                        COVER_DOMAIN,
-                        SERVICE_CLOSE_COVER,
-                        {"entity_id": self._source_entity_id},
-                    )
-                elif source_state.state == STATE_CLOSING:
-                    await self.hass.services.async_call(
-                        COVER_DOMAIN,
-                        SERVICE_OPEN_COVER,
-                        {"entity_id": self._source_entity_id},
-                    )
+        await self.hass.services.async_call(COVER_DOMAIN, service, self._service_data)
 
-        self.async_write_ha_state()
+    @property
+    def _source_supports_stop(self) -> bool:
+        """Return if the source cover has a native stop service."""
+        return bool((self._source_supported_features or 0) & CoverEntityFeature.STOP)
 
-    async def _async_stop_and_calculate_position(self) -> None:
-        """Stop cover and calculate current position if moving."""
-        if self._is_moving():
+    async def _async_stop_and_calculate_position(
+        self, send_device_stop: bool = False
+    ) -> None:
+        """Freeze the tracked position, optionally stopping the source cover."""
+        was_moving = bool(self._movement_direction)
+        if was_moving:
             self._current_position = self._calculate_current_position()
-            await self._async_stop_cover_internal()
+            self._reset_movement_state()
+            self._cancel_position_timer()
+
+        # A following open/close supersedes a native stop, but sources without
+        # one are halted by the opposite command and still need it.
+        if send_device_stop or (was_moving and not self._source_supports_stop):
+            await self._async_send_stop()
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Set the cover position."""
@@ -302,80 +397,62 @@ class SmartShutterCover(CoverEntity, RestoreEntity):
         if position is None:
             return
 
+        # Slider drags repeat the same target; don't touch the device again.
+        if self._movement_direction:
+            if position == self._target_position:
+                return
+        elif position == self._current_position:
+            return
+
+        was_moving = bool(self._movement_direction)
         await self._async_stop_and_calculate_position()
 
         if position == self._current_position:
+            if was_moving:
+                if self._source_supports_stop:
+                    await self._async_send_stop()
+                self.async_write_ha_state()
             return
 
         self._target_position = position
         delta = position - self._current_position
 
         if delta > 0:
-            direction = "opening"
-            time_for_full = self._time_to_open
+            direction = _DIR_OPENING
             service = SERVICE_OPEN_COVER
         else:
-            direction = "closing"
-            time_for_full = self._time_to_close
+            direction = _DIR_CLOSING
             service = SERVICE_CLOSE_COVER
 
-        travel_time = (abs(delta) / 100) * time_for_full
+        travel_time = self._travel_time(delta)
 
         self._start_movement(direction, position)
 
         await self.hass.services.async_call(
             COVER_DOMAIN,
             service,
-            {"entity_id": self._source_entity_id},
+            self._service_data,
         )
 
-        self._position_timer = self.hass.async_create_task(
-            self._async_position_timer(travel_time, position)
+        self._position_timer = self.hass.loop.call_later(
+            travel_time, self._async_position_reached, position
         )
 
-    def _start_movement(self, direction: str, target: int) -> None:
+    def _start_movement(self, direction: int, target: int) -> None:
         """Start tracking movement."""
         self._movement_direction = direction
-        self._movement_start_time = time.monotonic()
+        self._movement_start_time = self.hass.loop.time()
         self._movement_start_position = self._current_position
         self._target_position = target
         self.async_write_ha_state()
 
-    async def _async_position_timer(self, delay: float, target_position: int) -> None:
-        """Timer to stop cover at target position."""
-        try:
-            await asyncio.sleep(delay)
-
-            self._current_position = target_position
-            self._movement_direction = None
-            self._movement_start_time = None
-            self._movement_start_position = None
-            self._target_position = None
-
-            source_state = self.hass.states.get(self._source_entity_id)
-            if source_state:
-                features = source_state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
-                if features & CoverEntityFeature.STOP:
-                    await self.hass.services.async_call(
-                        COVER_DOMAIN,
-                        SERVICE_STOP_COVER,
-                        {"entity_id": self._source_entity_id},
-                    )
-                else:
-                    if source_state.state == STATE_OPENING:
-                        await self.hass.services.async_call(
-                            COVER_DOMAIN,
-                            SERVICE_CLOSE_COVER,
-                            {"entity_id": self._source_entity_id},
-                        )
-                    elif source_state.state == STATE_CLOSING:
-                        await self.hass.services.async_call(
-                            COVER_DOMAIN,
-                            SERVICE_OPEN_COVER,
-                            {"entity_id": self._source_entity_id},
-                        )
+    @callback
+    def _async_position_reached(self, target_position: int) -> None:
+        """Stop the cover once the travel time to the target has elapsed."""
+        self._position_timer = None
+        self._current_position = target_position
+        self._reset_movement_state()
 
-            self.async_write_ha_state()
+        self.hass.async_create_task(self._async_send_stop())
 
-        except asyncio.CancelledError:
-            pass
+        self.async_write_ha_state()